@@ -4,7 +4,13 @@
 Game class implementing the game logic and rules.
 """
 
+import os
+import sys
 import numpy
+try:
+    import resource
+except ImportError:
+    resource = None
 
 from strategies import *
 from players import *
@@ -27,6 +33,33 @@ class Asteroid(object):
         return self.base_reward + pu + pt
 
 
+def resource_usage():
+    """
+    Return the resident set size (in kB), whether that is the peak rather
+    than the current RSS, and the number of open file descriptors of this
+    process. The current RSS and open files are read from /proc; without
+    it the peak RSS is reported instead, and None where neither is available.
+    """
+    rss, peak = None, False
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    rss = int(line.split()[1])
+                    break
+    except OSError:
+        if resource is not None:
+            rss, peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, True
+            if sys.platform == 'darwin':
+                # ru_maxrss is in bytes on macOS
+                rss //= 1024
+    try:
+        open_files = len(os.listdir('/proc/self/fd'))
+    except OSError:
+        open_files = None
+    return rss, peak, open_files
+
+
 class Game(object):
 
     # game parameters ("static" constants, must be changed before instantiating a new Game)
@@ -38,6 +71,8 @@ class Game(object):
     FAILURE_RATE = 0.1
     FAILURE_RATE_ATTENUATION = 0.98
     LAUNCH_COST = 5
+    MARATHON_LOG_BYTES = 1 << 20        # rotate player logs past this size in marathon mode
+    MARATHON_REPORT_INTERVAL = 100      # rounds between memory reports in marathon mode
 
     players = list()
     losers = list()
@@ -52,13 +87,20 @@ class Game(object):
         'last_mining_payoff': None,
     }
 
-    def __init__(self, players):
+    def __init__(self, players, marathon=False):
         """
         Initialize a new game with the given list of players.
         Remove players with unset strategies (absent network players).
+        In marathon mode, bankrupt players are compacted into summary records,
+        player logs are rotated into compressed segments and memory usage is
+        reported periodically, so that long unbounded games run in bounded memory.
         """
+        self.marathon = marathon
+        self.players = list()
+        self.losers = list()
+        max_log_bytes = self.MARATHON_LOG_BYTES if marathon else 0
         for name, strategy in players.items():
-            self.players.append(Player(strategy, name, self.INITIAL_BANKROLL, self.INITIAL_TECH))
+            self.players.append(Player(strategy, name, self.INITIAL_BANKROLL, self.INITIAL_TECH, max_log_bytes))
         self.players = [p for p in self.players if p.strategy]
         self.public_information['last_winning_miner'] = ''
         self.public_information['last_winning_bid'] = 0
@@ -72,11 +114,34 @@ class Game(object):
         for player in self.players:
             if player.is_bankrupt():
                 self.broadcast(player.name + ' is bankrupt in round {}.'.format(self.round))
-                self.losers.append(player)
                 player.end(self.public_information)
+                if self.marathon:
+                    self.losers.append(self.summary(player))
+                    del self.public_information['players'][player.name]
+                else:
+                    self.losers.append(player)
         # can't remove from list while iterating it
         self.players = [p for p in self.players if not p.is_bankrupt()]
 
+    def summary(self, player):
+        """
+        Compact record of a finished player, kept instead of the Player itself.
+        """
+        return {
+            'name': player.name,
+            'round': self.round,
+            'bankroll': player.bankroll,
+            'tech': player.tech,
+        }
+
+    def report_usage(self):
+        """
+        Print memory and open-file usage, to check long games stay flat.
+        """
+        rss, peak, open_files = resource_usage()
+        print("Round {}: {} players, {} losers, {} {} kB, {} open files.".format(
+            self.round, len(self.players), len(self.losers), 'peak RSS' if peak else 'RSS', rss, open_files))
+
     def next_round(self):
         """Start the next round of the game."""
         self.round += 1
@@ -209,6 +274,8 @@ class Game(object):
             player.begin(self.public_information)
         while len(self.players) > 1 and (max_rounds == 0 or self.round <= max_rounds):
             self.next_round()
+            if self.marathon and self.round % self.MARATHON_REPORT_INTERVAL == 0:
+                self.report_usage()
             self.discovery()
             self.business()
             self.remove_bankrupt_players()
@@ -225,6 +292,8 @@ class Game(object):
                 self.public_information['auction_round'] = None
                 self.mission()
         self.report()
+        if self.marathon:
+            self.report_usage()
         for player in self.players:
             player.end(self.public_information)
 
@@ -7,6 +7,9 @@ All different player types are implemented here.
 import xmlrpc.client
 import json
 import os
+import glob
+import gzip
+import shutil
 from time import strftime
 import pathlib
 
@@ -14,26 +17,31 @@ class Player(object):
     """Player class for all players. Implements book-keeping, bidding and
         launching (via RPC or local strategy)."""
 
-    def __init__(self, strategy, name='', bankroll=1000, tech=0):
+    def __init__(self, strategy, name='', bankroll=1000, tech=0, max_log_bytes=0):
         """
         Create new player with explicit strategy or delegate to RPC server.
         strategy is either a Strategy object instance, or a string indicating the
         server address and port in usual format:
         name@ip.address:port
         where the name@ part is optional and ignored.
+        If max_log_bytes is positive, the statistics log is rotated into
+        gzipped segments (<log>.1.gz, <log>.2.gz, ...) once it grows past that size.
         """
         self.bankroll = bankroll
         self.tech = tech
         self.name = name
         self.launching = False
         self.last_bid = 0
+        self.max_log_bytes = max_log_bytes
+        self.log_segments = 0
         logpath = str(pathlib.Path.home()) + '/logs/' + self.name
         pathlib.Path(logpath).mkdir(parents=True, exist_ok=True)
         self.stats_file = logpath + '/' + strftime("%Y-%m-%d") + '.log'
-        try:
-            os.remove(self.stats_file)
-        except:
-            pass
+        for old_file in [self.stats_file] + glob.glob(glob.escape(self.stats_file) + '.*.gz'):
+            try:
+                os.remove(old_file)
+            except:
+                pass
         with open(self.stats_file, 'w') as stats_file:
             stats_file.write('[]\n')
         if isinstance(strategy, str):
@@ -78,6 +86,21 @@ class Player(object):
                else:
                    stats_file.write(",\n{}]\n".format(json.dumps(information)))
                #stats_file.close()
+               size = stats_file.tell()
+            if self.max_log_bytes > 0 and size > self.max_log_bytes:
+                self.rotate_statistics()
+
+    def rotate_statistics(self):
+        """
+        Compress the current statistics log (a complete JSON array) into the
+        next numbered segment and start a new, empty log.
+        """
+        self.log_segments += 1
+        segment = "{}.{}.gz".format(self.stats_file, self.log_segments)
+        with open(self.stats_file, 'rb') as stats_file, gzip.open(segment, 'wb') as segment_file:
+            shutil.copyfileobj(stats_file, segment_file)
+        with open(self.stats_file, 'w') as stats_file:
+            stats_file.write('[]\n')
 
     def begin(self, public_information):
         private_information = self._get_private_information()
@@ -16,8 +16,13 @@ def main(argv):
         sys.exit(1)
 
     from players_rc import player_dict
-    game = Game(player_dict)
-    winners = game.run()
+    if '--marathon' in argv:
+        # play until one player is left, in bounded memory
+        game = Game(player_dict, marathon=True)
+        winners = game.run(max_rounds=0)
+    else:
+        game = Game(player_dict)
+        winners = game.run()
     if len(winners) == 0:
         game.broadcast("All players went bankrupt")
     else:
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+
+"""
+Solver for a simplified, two-player Space Mining Poker.
+
+The simplified game keeps the business phase, a single sealed-bid auction
+per round, a simultaneous launch (or join) decision and the tech-weighted
+mission lottery, where mission failure has weight FAILURE_RATE times the
+total launched tech as in Game.mission. If nobody launches, tech carries
+over to the next round. Bankroll is discretized on a grid and tech is
+capped; the asteroid payoff is replaced by its expectation, and the
+failure rate is not attenuated over rounds. The opponent plays its policy
+at the initial bankroll.
+
+Best responses are computed by value iteration and approximate symmetric
+equilibria by fictitious play, vectorized over all states with numpy.
+The solved policy can be exported as a TableStrategy for use in a Game.
+"""
+
+import sys
+import numpy
+
+from game import Game
+from strategies import TableStrategy
+
+
+# mean of int(lognormal() * 7), used for both the base and the unknown reward
+ASTEROID_REWARD_MEAN = 7 * numpy.exp(0.5) - 0.5
+
+
+class SimplifiedGame(object):
+    """
+    Simplified game on a grid of (bankroll, tech) states, as seen by one
+    player after the business phase. Actions are (bid, launching) pairs.
+    The opponent is described by a joint distribution over its tech and
+    actions, taken from its policy at the initial bankroll.
+    """
+
+    def __init__(self, bids=(0, 1, 2, 4, 8, 16, 32), max_tech=40, bankroll_step=50,
+                 max_bankroll=2 * Game.INITIAL_BANKROLL, discount=0.95):
+        self.bids = numpy.array(bids)
+        self.tech = numpy.arange(max_tech + 1)
+        self.bankroll = numpy.arange(0, max_bankroll + 1, bankroll_step)
+        self.bankroll_step = bankroll_step
+        self.discount = discount
+        # action a is bid index a // 2, launching if a is odd
+        self.action_bid = numpy.repeat(self.bids, 2)
+        self.action_launch = numpy.tile([False, True], len(self.bids))
+        self.business_tech = numpy.ones(Game.BASE_TECH) / Game.BASE_TECH
+        self.auction_tech = numpy.ones(Game.AUCTION_TECH) / Game.AUCTION_TECH
+        self.initial_bankroll = min(int(round(Game.INITIAL_BANKROLL / bankroll_step)),
+                                    len(self.bankroll) - 1)
+        initial_tech = numpy.zeros(len(self.tech))
+        initial_tech[min(Game.INITIAL_TECH, max_tech)] = 1.0
+        self.initial_tech = self.business(initial_tech)
+
+    def business(self, tech_distribution):
+        """
+        Tech distribution after the business phase adds random tech.
+        """
+        top = len(self.tech) - 1
+        index = numpy.minimum(self.tech[:, None] + numpy.arange(len(self.business_tech))[None, :], top)
+        mass = tech_distribution[:, None] * self.business_tech[None, :]
+        return numpy.bincount(index.ravel(), weights=mass.ravel(), minlength=top + 1)
+
+    def opponent(self, policy, tech_distribution):
+        """
+        Joint distribution over opponent (tech, action), shape (tech, action).
+        """
+        return tech_distribution[:, None] * policy[self.initial_bankroll]
+
+    def outcomes(self, opponent):
+        """
+        Enumerate the outcomes of a round against the given opponent.
+        Outcomes are (auction won, auction tech, lottery won) classes.
+        Returns the probability, bankroll change and carried-over tech
+        of each class, each of shape (tech, action, class).
+        """
+        n_tech, n_action = len(self.tech), len(self.action_bid)
+        n_auction = len(self.auction_tech)
+        # axes: own tech, own action, opponent tech, opponent action, own auction tech
+        t1 = self.tech[:, None, None, None, None]
+        t2 = self.tech[None, None, :, None, None]
+        bid1 = self.action_bid[None, :, None, None, None]
+        bid2 = self.action_bid[None, None, None, :, None]
+        tau = numpy.arange(n_auction)[None, None, None, None, :]
+        # you must have at least some tech to launch
+        launch1 = self.action_launch[None, :, None, None, None] & (t1 > 0)
+        launch2 = self.action_launch[None, None, None, :, None] & (t2 > 0)
+        # ties are awarded to all highest bidders
+        won = bid1 >= bid2
+        w1 = numpy.where(launch1, t1 + tau * won, 0)
+        weight = opponent[None, None, :, :, None] * self.auction_tech[None, None, None, None, :]
+
+        prob = numpy.zeros((n_tech, n_action, 2, n_auction, 2))
+        reward = numpy.zeros(prob.shape)
+        expected_payoff = numpy.zeros((n_tech, n_action, 2, n_auction))
+        # each winner draws its own auction tech, so sum over the opponent's draw
+        for tau2, p2 in enumerate(self.auction_tech):
+            w2 = numpy.where(launch2, t2 + tau2 * (bid2 >= bid1), 0)
+            total = (1 + Game.FAILURE_RATE) * (w1 + w2)
+            p_win = numpy.divide(w1, total, out=numpy.zeros(total.shape), where=total > 0)
+            payoff = 2 * ASTEROID_REWARD_MEAN + numpy.sqrt(1.5 * total)
+            for w, mask in enumerate([~won, won]):
+                masked = numpy.broadcast_to(p2 * weight * mask, p_win.shape)
+                prob[:, :, w, :, 0] += (masked * (1 - p_win)).sum(axis=(2, 3))
+                prob[:, :, w, :, 1] += (masked * p_win).sum(axis=(2, 3))
+                expected_payoff[:, :, w] += (masked * p_win * payoff).sum(axis=(2, 3))
+        reward[..., 1] = numpy.divide(expected_payoff, prob[..., 1],
+                                      out=numpy.zeros(expected_payoff.shape),
+                                      where=prob[..., 1] > 0)
+        reward[:, :, 1] -= self.action_bid[None, :, None, None]
+        launching = self.action_launch[None, :] & (self.tech[:, None] > 0)
+        reward -= Game.LAUNCH_COST * launching[:, :, None, None, None]
+        # the next business phase is paid at the end of the round
+        reward -= Game.BASE_PRICE
+
+        carried = self.tech[:, None, None, None] + numpy.arange(2)[None, None, :, None] \
+            * numpy.arange(n_auction)[None, None, None, :]
+        carried = numpy.minimum(carried, len(self.tech) - 1)
+        carried = numpy.where(launching[:, :, None, None], 0, carried)
+        carried = numpy.broadcast_to(carried[..., None], prob.shape)
+
+        shape = (n_tech, n_action, -1)
+        return prob.reshape(shape), reward.reshape(shape), carried.reshape(shape)
+
+    def transitions(self, opponent):
+        """
+        Outcomes against the opponent, extended over bankroll: the
+        probability and bankroll change of each class, and the flat index
+        and weight of the two bankroll grid points either side of the
+        bankroll after it. Bankrupt outcomes get zero weight.
+        """
+        prob, reward, carried = self.outcomes(opponent)
+        top = len(self.bankroll) - 1
+        target = self.bankroll[:, None, None, None] + reward[None]
+        position = numpy.clip(target, 0, self.bankroll[-1]) / self.bankroll_step
+        lower = numpy.minimum(numpy.floor(position).astype(int), top - 1)
+        fraction = numpy.where(target < 0, 0.0, position - lower)
+        index = lower * len(self.tech) + carried[None]
+        weight = numpy.where(target < 0, 0.0, 1 - fraction)
+        return prob, reward, carried, index, weight, fraction
+
+    def q_values(self, value, transitions):
+        """
+        Action values, shape (bankroll, tech, action), given the state value
+        of the next round. Bankrupt players get no further reward, and
+        bids larger than the bankroll are not allowed.
+        """
+        prob, reward, _, index, weight, fraction = transitions
+        next_value = numpy.zeros(value.shape)
+        for u, p in enumerate(self.business_tech):
+            next_value += p * value[:, numpy.minimum(self.tech + u, len(self.tech) - 1)]
+        next_value = next_value.ravel()
+        continuation = weight * next_value[index] + fraction * next_value[index + len(self.tech)]
+
+        q = (prob[None] * (reward[None] + self.discount * continuation)).sum(axis=-1)
+        unaffordable = self.action_bid[None, None, :] > self.bankroll[:, None, None]
+        return numpy.where(unaffordable, -numpy.inf, q)
+
+    def best_response(self, transitions, value=None, tolerance=1e-3, max_iterations=2000):
+        """
+        Best response to the opponent, given by its transitions, by value
+        iteration, optionally starting from a previous value.
+        Returns the greedy action and value of each (bankroll, tech) state.
+        """
+        if value is None:
+            value = numpy.zeros((len(self.bankroll), len(self.tech)))
+        for _ in range(max_iterations):
+            q = self.q_values(value, transitions)
+            new_value = q.max(axis=-1)
+            converged = numpy.abs(new_value - value).max() < tolerance
+            value = new_value
+            if converged:
+                break
+        return q.argmax(axis=-1), value
+
+    def evaluate(self, policy, transitions, tolerance=1e-3, max_iterations=2000):
+        """
+        Value of each (bankroll, tech) state when playing the given mixed
+        policy, shape (bankroll, tech, action), against the opponent given
+        by its transitions.
+        """
+        value = numpy.zeros((len(self.bankroll), len(self.tech)))
+        for _ in range(max_iterations):
+            q = self.q_values(value, transitions)
+            new_value = (policy * numpy.where(policy > 0, q, 0.0)).sum(axis=-1)
+            converged = numpy.abs(new_value - value).max() < tolerance
+            value = new_value
+            if converged:
+                break
+        return value
+
+    def next_tech(self, policy, tech_distribution, transitions):
+        """
+        Tech distribution after one round (including the next business phase)
+        of playing the policy at the initial bankroll.
+        """
+        prob, _, carried = transitions[:3]
+        mass = tech_distribution[:, None, None] * policy[self.initial_bankroll][:, :, None] * prob
+        carried_distribution = numpy.bincount(carried.ravel(), weights=mass.ravel(),
+                                              minlength=len(self.tech))
+        return self.business(carried_distribution)
+
+    def one_hot(self, actions):
+        """
+        Pure policy, shape (bankroll, tech, action), playing the given actions.
+        """
+        return numpy.eye(len(self.action_bid))[actions]
+
+    def uniform_policy(self):
+        """
+        Mixed policy choosing uniformly between all affordable actions.
+        """
+        feasible = self.action_bid[None, :] <= self.bankroll[:, None]
+        policy = numpy.broadcast_to(feasible[:, None, :], (len(self.bankroll), len(self.tech), len(self.action_bid)))
+        return policy / policy.sum(axis=-1, keepdims=True)
+
+    def fictitious_play(self, iterations=30):
+        """
+        Approximate a symmetric equilibrium by fictitious play: repeatedly
+        best respond to the average policy so far, and track the opponent's
+        tech distribution under that policy.
+        Returns the average mixed policy and the opponent tech distribution.
+        """
+        policy = self.uniform_policy()
+        tech_distribution = self.initial_tech
+        value = None
+        for iteration in range(iterations):
+            transitions = self.transitions(self.opponent(policy, tech_distribution))
+            actions, value = self.best_response(transitions, value)
+            policy = policy + (self.one_hot(actions) - policy) / (iteration + 2)
+            tech_distribution = self.next_tech(policy, tech_distribution, transitions)
+        return policy, tech_distribution
+
+    def exploitability(self, policy, tech_distribution):
+        """
+        How much a best response gains over the policy when playing against
+        it, in expected discounted money from the start of the game.
+        """
+        transitions = self.transitions(self.opponent(policy, tech_distribution))
+        _, best_value = self.best_response(transitions)
+        value = self.evaluate(policy, transitions)
+        start = self.initial_bankroll
+        return self.initial_tech @ (best_value[start] - value[start])
+
+    def strategy(self, policy):
+        """
+        Export the most likely action of each state as a TableStrategy.
+        """
+        actions = policy.argmax(axis=-1)
+        return TableStrategy(self.action_bid[actions], self.action_launch[actions], self.bankroll_step)
+
+
+def main(argv):
+    iterations = int(argv[0]) if len(argv) > 0 else 30
+    game = SimplifiedGame()
+    policy, tech_distribution = game.fictitious_play(iterations)
+    print("Exploitability after %d iterations: %.2f"
+          % (iterations, game.exploitability(policy, tech_distribution)))
+    strategy = game.strategy(policy)
+    start = game.initial_bankroll
+    print("Policy at bankroll %d:" % game.bankroll[start])
+    for t in game.tech:
+        print("tech %2d: bid %2d, launch %s" % (t, strategy.bids[start][t], strategy.launches[start][t]))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -169,3 +169,32 @@ class EVBot(Strategy):
     def join_launch(self, private_information, public_information):
         return False
 
+
+class TableStrategy(Strategy):
+    """
+    TableStrategy looks up its bid and launch decisions in precomputed tables
+    indexed by bankroll bin and tech, such as a policy exported by solver.py.
+    bids[i][t] and launches[i][t] are the decisions for a bankroll of about
+    i * bankroll_step and tech t; larger values use the last bin.
+    """
+
+    def __init__(self, bids, launches, bankroll_step):
+        self.bids = [[int(amount) for amount in row] for row in bids]
+        self.launches = [[bool(launching) for launching in row] for row in launches]
+        self.bankroll_step = bankroll_step
+
+    def _lookup(self, private_information):
+        i = int(private_information['bankroll'] / self.bankroll_step + 0.5)
+        i = min(max(i, 0), len(self.bids) - 1)
+        t = min(max(int(private_information['tech']), 0), len(self.bids[i]) - 1)
+        return i, t
+
+    def bid(self, private_information, public_information):
+        i, t = self._lookup(private_information)
+        amount = min(private_information['bankroll'], self.bids[i][t])
+        launching = self.launches[i][t]
+        return int(amount), launching
+
+    def join_launch(self, private_information, public_information):
+        i, t = self._lookup(private_information)
+        return self.launches[i][t]
@@ -0,0 +1,77 @@
+"""
+Checks of the simplified game solver and TableStrategy on a small grid.
+"""
+
+import numpy
+import pytest
+
+from game import Game
+from solver import SimplifiedGame
+from strategies import TableStrategy, SpongeBob, PassiveLauncher
+
+
+@pytest.fixture
+def small_game():
+    return SimplifiedGame(bids=(0, 2, 8), max_tech=12, bankroll_step=100, max_bankroll=400)
+
+
+@pytest.fixture
+def transitions(small_game):
+    opponent = small_game.opponent(small_game.uniform_policy(), small_game.initial_tech)
+    return small_game.transitions(opponent)
+
+
+def test_outcome_probabilities_sum_to_one(small_game):
+    opponent = small_game.opponent(small_game.uniform_policy(), small_game.initial_tech)
+    prob, _, carried = small_game.outcomes(opponent)
+    assert opponent.sum() == pytest.approx(1.0)
+    assert numpy.allclose(prob.sum(axis=-1), 1.0)
+    assert carried.min() >= 0 and carried.max() < len(small_game.tech)
+
+
+def test_tech_distribution_keeps_its_mass(small_game, transitions):
+    tech_distribution = small_game.initial_tech
+    for _ in range(120):
+        tech_distribution = small_game.next_tech(small_game.uniform_policy(), tech_distribution, transitions)
+    assert tech_distribution.sum() == pytest.approx(1.0)
+
+
+def test_transitions_clip_bankroll_and_drop_bankrupt_outcomes(small_game, transitions):
+    _, reward, _, index, weight, fraction = transitions
+    target = small_game.bankroll[:, None, None, None] + reward[None]
+    n_states = len(small_game.bankroll) * len(small_game.tech)
+    assert index.min() >= 0 and (index + len(small_game.tech)).max() < n_states
+    assert numpy.all(weight[target < 0] == 0) and numpy.all(fraction[target < 0] == 0)
+    assert numpy.allclose((weight + fraction)[target >= 0], 1.0)
+
+
+def test_best_response_converges(small_game, transitions):
+    actions, value = small_game.best_response(transitions, tolerance=1e-6)
+    q = small_game.q_values(value, transitions)
+    assert numpy.abs(q.max(axis=-1) - value).max() < 1e-5
+    assert numpy.array_equal(q.argmax(axis=-1), actions)
+
+
+def test_exploitability_is_not_negative(small_game, transitions):
+    actions, _ = small_game.best_response(transitions)
+    policy = small_game.one_hot(actions)
+    assert small_game.exploitability(policy, small_game.initial_tech) >= -1e-2
+
+
+def test_table_lookup_clamps_bankroll_and_tech():
+    strategy = TableStrategy([[1, 2], [3, 4], [5, 6]], [[False, True]] * 3, bankroll_step=100)
+    assert strategy._lookup({'bankroll': -50, 'tech': -1}) == (0, 0)
+    assert strategy._lookup({'bankroll': 149, 'tech': 1}) == (1, 1)
+    assert strategy._lookup({'bankroll': 10 ** 6, 'tech': 99}) == (2, 1)
+    assert strategy.bid({'bankroll': 1, 'tech': 99}, {}) == (1, True)
+    assert strategy.join_launch({'bankroll': 250, 'tech': 0}, {}) is False
+
+
+def test_table_strategy_plays_a_game(small_game, transitions, tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path))
+    actions, _ = small_game.best_response(transitions)
+    strategy = small_game.strategy(small_game.one_hot(actions))
+    game = Game({'Solved': strategy, 'SpongeBob': SpongeBob(), 'Passive': PassiveLauncher()})
+    game.run(max_rounds=5)
+    assert game.round >= 1
+    assert all(isinstance(player.bankroll, int) for player in game.players + game.losers)